@@ -7,142 +7,681 @@ Generates a single-page real estate tour from listing data and photos.
 __version__ = "4.0.0"  # Phase 4 with image optimization and multi-folder support
 
 import argparse
+import functools
+import hashlib
+import importlib.util
 import json
+import mmap
 import os
+import re
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 try:
-    from PIL import Image
+    import PIL
+    from PIL import Image, ImageOps
     PILLOW_AVAILABLE = True
+    # Pillow-SIMD (AVX2 resize filters) is a drop-in fork versioned like "9.5.0.post1"
+    PILLOW_SIMD = ".post" in PIL.__version__
 except ImportError:
     PILLOW_AVAILABLE = False
+    PILLOW_SIMD = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+try:
+    # SIMD-vectorized hashing for incremental-build change detection
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+# numpy and PyTurboJPEG are only looked up here and imported on first use
+# (_get_numpy/_get_turbojpeg): numpy alone adds ~50 ms to every CLI start
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+# PyTurboJPEG decodes into numpy arrays, so it needs numpy as well
+TURBOJPEG_AVAILABLE = NUMPY_AVAILABLE and importlib.util.find_spec("turbojpeg") is not None
+
+# orjson parses bytes directly and is several times faster than the stdlib scanner
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+def _json_dumps(obj):
+    """Serialize obj as indented UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
 
 # Constants
 ROOT_DIR = Path(__file__).parent
 TEMPLATES_DIR = ROOT_DIR / "templates"
 STATIC_DIR = ROOT_DIR / "static"
+COMPILED_TEMPLATES_DIR = ROOT_DIR / "compiled_templates"
+JINJA_CACHE_DIR = ROOT_DIR / ".jinja_cache"
 
-def optimize_image(src_path, dest_path, max_width=1920, quality=85):
-    """Optimize image for web with size and quality adjustments."""
-    if not PILLOW_AVAILABLE:
-        # Fallback to simple copy if Pillow not available
+class ListingError(Exception):
+    """Raised when a listing cannot be loaded or built; the CLI reports it and exits."""
+
+# Required listing.json fields (see README "Required Fields")
+REQUIRED_LISTING_FIELDS = frozenset({"title", "address", "details"})
+REQUIRED_DETAIL_FIELDS = frozenset({"price", "beds", "baths", "sqft"})
+
+# Wizard menu options, in the order they are numbered on screen (first is the default)
+THEMES = ("classic-light", "luxury-dark", "modern-light")
+HERO_STYLES = ("single", "slider", "video")
+
+# Gallery photos are matched case-insensitively on lowercased names
+PHOTO_EXTENSIONS = ('.jpg', '.jpeg')
+EXCLUDED_PHOTOS = frozenset({'hero.jpg', 'agent.jpg'})
+
+# Platform detection for the file copy fast paths
+IS_LINUX = sys.platform.startswith("linux")
+IS_WINDOWS = sys.platform == "win32"
+IS_MACOS = sys.platform == "darwin"
+FICLONE = 0x40049409  # _IOW(0x94, 9, int) from linux/fs.h
+
+def _try_reflink(src_path, dest_path):
+    """Clone a file copy-on-write (FICLONE on Linux, clonefile on macOS), return True on success."""
+    try:
+        if IS_LINUX:
+            import fcntl
+            src_fd = os.open(src_path, os.O_RDONLY)
+            try:
+                st = os.fstat(src_fd)
+                dest_fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, st.st_mode & 0o777)
+                try:
+                    fcntl.ioctl(dest_fd, FICLONE, src_fd)
+                finally:
+                    os.close(dest_fd)
+            finally:
+                os.close(src_fd)
+            os.utime(dest_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+            return True
+        
+        if IS_MACOS:
+            import ctypes
+            libsystem = ctypes.CDLL("/usr/lib/libSystem.dylib", use_errno=True)
+            # clonefile() copies metadata itself but fails if its target exists,
+            # so clone beside dest and rename over it; rebuilds still get a clone
+            tmp_path = os.fsencode(dest_path) + b".clone.tmp"
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            if libsystem.clonefile(os.fsencode(src_path), tmp_path, 0) == 0:
+                os.replace(tmp_path, dest_path)
+                return True
+    except OSError:
+        # EXDEV/EOPNOTSUPP/EINVAL etc: different volumes or no CoW support
+        pass
+    return False
+
+def _sendfile_copy(src_path, dest_path):
+    """Copy file contents in-kernel and carry over timestamps.
+    
+    copy_file_range() comes first: NFS 4.2/SMB can copy server-side and some
+    filesystems share extents. sendfile() covers older kernels and
+    cross-filesystem copies that copy_file_range() rejects.
+    """
+    src_fd = os.open(src_path, os.O_RDONLY)
+    try:
+        st = os.fstat(src_fd)
+        dest_fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, st.st_mode & 0o777)
+        try:
+            chunk = max(st.st_size, 1 << 20)
+            copied = 0
+            if hasattr(os, "copy_file_range"):
+                try:
+                    while True:
+                        sent = os.copy_file_range(src_fd, dest_fd, chunk)
+                        if not sent:
+                            break
+                        copied += sent
+                except OSError:
+                    # ENOSYS/EXDEV/EINVAL: only safe to switch over before any data moved
+                    if copied:
+                        raise
+            if not copied:
+                while os.sendfile(dest_fd, src_fd, None, chunk):
+                    pass
+        finally:
+            os.close(dest_fd)
+    finally:
+        os.close(src_fd)
+    
+    # Mirror what copy2 adds over copyfile, minus the xattr/flags probes
+    os.utime(dest_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+def _copyfile2(src_path, dest_path):
+    """Copy a file with the native Windows CopyFile2 API, return True on success."""
+    try:
+        import ctypes
+        result = ctypes.windll.kernel32.CopyFile2(str(src_path), str(dest_path), None)
+    except (AttributeError, OSError):
+        return False
+    return result == 0  # S_OK
+
+def _buffered_copy(src_path, dest_path):
+    """Copy through one reused 1 MiB buffer, then carry over metadata like copy2."""
+    buf = bytearray(1 << 20)
+    view = memoryview(buf)
+    with open(src_path, 'rb') as fsrc, open(dest_path, 'wb') as fdst:
+        while (n := fsrc.readinto(buf)):
+            fdst.write(view[:n])
+    shutil.copystat(src_path, dest_path)
+
+def copy_file(src_path, dest_path):
+    """Copy a file using the platform's zero-copy path, falling back to a buffered copy."""
+    # Same-volume Btrfs/XFS/APFS copies share extents and finish in O(1)
+    if _try_reflink(src_path, dest_path):
+        return
+    
+    if IS_LINUX:
+        try:
+            _sendfile_copy(src_path, dest_path)
+            return
+        except OSError:
+            pass
+    elif IS_WINDOWS:
+        if _copyfile2(src_path, dest_path):
+            return
+    elif IS_MACOS:
+        # copyfile() goes through fcopyfile(), the native in-kernel copy
         shutil.copy2(src_path, dest_path)
         return
     
+    _buffered_copy(src_path, dest_path)
+
+def install_static_file(src_path, dest_path, link=False):
+    """Place a static asset at dest_path, hard-linking instead of copying when link is set."""
+    # Replace rather than overwrite: dest may be a hard link to the source left by
+    # an earlier --link-static build, and writing through it would modify static/
     try:
-        img = Image.open(src_path)
-        
-        # Convert RGBA to RGB if needed
-        if img.mode in ('RGBA', 'LA', 'P'):
-            bg = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'RGBA':
-                bg.paste(img, mask=img.split()[-1])
+        os.unlink(dest_path)
+    except FileNotFoundError:
+        pass
+    
+    if link:
+        try:
+            os.link(src_path, dest_path)
+            return
+        except OSError:
+            # Cross-device output or no link permission (e.g. Windows without admin)
+            pass
+    
+    shutil.copy2(src_path, dest_path)
+
+@functools.lru_cache(maxsize=1)
+def _get_numpy():
+    """Import numpy on first use."""
+    import numpy
+    return numpy
+
+@functools.lru_cache(maxsize=1)
+def _get_turbojpeg():
+    """Return this process's TurboJPEG instance, or None if libturbojpeg cannot be loaded."""
+    if not TURBOJPEG_AVAILABLE:
+        return None
+    try:
+        from turbojpeg import TurboJPEG
+        return TurboJPEG()  # thread-safe; one instance per process
+    except (ImportError, OSError, RuntimeError):
+        # RuntimeError/OSError: PyTurboJPEG is installed but libturbojpeg is not
+        return None
+
+def save_jpeg(img, dest_path, quality, progressive=False, icc_profile=None):
+    """Encode an image as JPEG, using libjpeg-turbo's SIMD encoder when available.
+    
+    No EXIF or other camera metadata is written; icc_profile is embedded
+    only when given.
+    """
+    codec = _get_turbojpeg() if img.mode == 'RGB' and not icc_profile else None
+    if codec is not None:
+        from turbojpeg import TJFLAG_PROGRESSIVE, TJPF_RGB, TJSAMP_420
+        # Pillow hands over RGB pixels, so no BGR channel swap is needed
+        jpeg = codec.encode(
+            _get_numpy().asarray(img),
+            quality=quality,
+            pixel_format=TJPF_RGB,
+            jpeg_subsample=TJSAMP_420,
+            flags=TJFLAG_PROGRESSIVE if progressive else 0
+        )
+        with open(dest_path, 'wb') as f:
+            f.write(jpeg)
+        return
+    
+    img.save(dest_path, 'JPEG', quality=quality, optimize=True, progressive=progressive,
+             icc_profile=icc_profile)
+
+# JPEG segments dropped when copying a photo through unchanged: APP1 (EXIF,
+# XMP), APP13 (Photoshop/IPTC), COM and APP2 ICC profiles unless kept
+_JPEG_METADATA_MARKERS = frozenset({0xE1, 0xED, 0xFE})
+_JPEG_ICC_MARKER = 0xE2
+
+def copy_jpeg_without_metadata(src_path, dest_path, keep_icc=False):
+    """Copy a JPEG losslessly, leaving out camera metadata segments.
+    
+    Only the header (everything before the first SOS marker) is parsed; the
+    entropy-coded data is copied as-is. Files with nothing to strip go
+    through copy_file() and its zero-copy fast paths.
+    """
+    with open(src_path, 'rb') as src:
+        if src.read(2) != b'\xff\xd8':
+            raise ValueError("not a JPEG file")
+        kept = [b'\xff\xd8']
+        stripped = False
+        while True:
+            if src.read(1) != b'\xff':
+                raise ValueError("malformed JPEG header")
+            # Any number of 0xFF fill bytes may precede the marker code
+            code = src.read(1)
+            while code == b'\xff':
+                code = src.read(1)
+            if not code:
+                raise ValueError("malformed JPEG header")
+            marker = b'\xff' + code
+            if marker[1] == 0xDA:
+                # Start of scan: the rest of the file is image data
+                kept.append(marker)
+                break
+            if marker[1] == 0x01 or 0xD0 <= marker[1] <= 0xD7:
+                # Standalone markers carry no length or payload
+                kept.append(marker)
+                continue
+            length_bytes = src.read(2)
+            segment = src.read(int.from_bytes(length_bytes, 'big') - 2)
+            drop = marker[1] in _JPEG_METADATA_MARKERS or (
+                marker[1] == _JPEG_ICC_MARKER and not keep_icc
+                and segment.startswith(b'ICC_PROFILE\0')
+            )
+            if drop:
+                stripped = True
             else:
-                bg.paste(img)
-            img = bg
+                kept.append(marker + length_bytes + segment)
         
-        # Resize if needed
-        if img.width > max_width:
-            ratio = max_width / img.width
-            new_size = (max_width, int(img.height * ratio))
-            img = img.resize(new_size, Image.LANCZOS)
+        if not stripped:
+            src.close()
+            copy_file(src_path, dest_path)
+            return
+        
+        with open(dest_path, 'wb') as dest:
+            dest.write(b''.join(kept))
+            shutil.copyfileobj(src, dest, 1024 * 1024)
+
+def source_icc_profile(src_path):
+    """Read a photo's embedded ICC profile from its header, or None."""
+    try:
+        with Image.open(src_path) as img:
+            return img.info.get('icc_profile')
+    except Exception:
+        return None
+
+def _decode_scaled_jpeg(codec, src_path, max_width):
+    """Decode a JPEG with libjpeg-turbo, scaling inside the IDCT to just above max_width."""
+    from turbojpeg import TJPF_RGB
+    
+    with open(src_path, 'rb') as f:
+        jpeg = f.read()
+    
+    # Pick the biggest reduction that still leaves at least max_width pixels, so
+    # any remaining resize only ever shrinks
+    width = codec.decode_header(jpeg)[0]
+    scaling_factor = None
+    best_width = width
+    for num, denom in codec.scaling_factors:
+        scaled_width = -(-width * num // denom)  # ceil, as libjpeg-turbo rounds up
+        if max_width <= scaled_width < best_width:
+            scaling_factor, best_width = (num, denom), scaled_width
+    
+    pixels = codec.decode(jpeg, pixel_format=TJPF_RGB, scaling_factor=scaling_factor)
+    return Image.fromarray(pixels)
+
+def flatten_to_rgb(img):
+    """Composite transparent images onto white and return an RGB image.
+    
+    RGBA and LA are alpha-blended, with or without numpy and to the same
+    bytes; P images are pasted as-is.
+    """
+    if img.mode not in ('RGBA', 'LA', 'P'):
+        return img
+    
+    if img.mode in ('RGBA', 'LA') and NUMPY_AVAILABLE:
+        np = _get_numpy()
+        # One vectorized blend instead of paste(); the rounding matches Pillow's
+        rgba = np.asarray(img.convert('RGBA'), dtype=np.uint16)
+        alpha = rgba[..., 3:4]
+        out = (rgba[..., :3] * alpha + 255 * (255 - alpha) + 127) // 255
+        return Image.fromarray(out.astype(np.uint8), 'RGB')
+    
+    bg = Image.new('RGB', img.size, (255, 255, 255))
+    if img.mode in ('RGBA', 'LA'):
+        bg.paste(img.convert('RGBA'), mask=img.getchannel('A'))
+    else:
+        bg.paste(img)
+    return bg
+
+# Modern formats written beside each gallery JPEG, best first, when this Pillow
+# build can encode them: (extension, Pillow format, MIME type, save options).
+# AVIF is opt-in (--avif): it encodes several times slower than the JPEG itself.
+# WebP is on by default but roughly triples a cold build; --no-webp skips it.
+WEB_IMAGE_FORMATS: Tuple[Tuple[str, str, str, Dict[str, Any]], ...] = (
+    ("avif", "AVIF", "image/avif", {}),
+    ("webp", "WEBP", "image/webp", {"method": 6}),
+)
+
+@functools.lru_cache(maxsize=4)
+def available_web_formats(avif=False, webp=True):
+    """Return the enabled WEB_IMAGE_FORMATS entries this Pillow build can save."""
+    if not PILLOW_AVAILABLE:
+        return ()
+    Image.init()
+    enabled = {"avif": avif, "webp": webp}
+    return tuple(entry for entry in WEB_IMAGE_FORMATS
+                 if entry[1] in Image.SAVE and enabled[entry[0]])
+
+def web_variant_path(path, extension):
+    """Path of the modern-format variant written next to a JPEG output.
+    
+    The full filename is kept (a.jpg.webp), so a.jpg and a.jpeg never share a variant.
+    """
+    return f"{os.fspath(path)}.{extension}"
+
+# EXIF tag holding how a camera-rotated photo must be turned to display upright
+EXIF_ORIENTATION = 0x0112
+
+def load_web_image(src_path, max_width=1920):
+    """Decode a source photo once as upright RGB, no wider than max_width."""
+    img = Image.open(src_path)
+    orientation = img.getexif().get(EXIF_ORIENTATION, 1)
+    
+    # Rotated photos go through Pillow so exif_transpose can turn them upright
+    codec = None
+    if orientation == 1 and os.path.splitext(src_path)[1].lower() in PHOTO_EXTENSIONS:
+        codec = _get_turbojpeg()
+    decoded = None
+    if codec is not None:
+        try:
+            decoded = _decode_scaled_jpeg(codec, src_path, max_width)
+        except (OSError, ValueError):
+            # e.g. CMYK or 12-bit JPEGs; let Pillow handle them
+            decoded = None
+    
+    if decoded is not None:
+        img.close()
+        img = decoded
+    else:
+        # Orientations 5-8 are stored sideways, so the upright width is the stored height
+        upright_width = img.height if orientation in (5, 6, 7, 8) else img.width
+        # For JPEGs, let libjpeg scale by 1/2, 1/4 or 1/8 during decode (no-op otherwise)
+        if upright_width > max_width:
+            img.draft('RGB', (img.width * max_width // upright_width,
+                              img.height * max_width // upright_width))
+        img.load()
+        if orientation != 1:
+            img = ImageOps.exif_transpose(img)
+    
+    # Convert RGBA to RGB if needed
+    img = flatten_to_rgb(img)
+    
+    # Resize if needed (only what decode-time scaling left over)
+    if img.width > max_width:
+        ratio = max_width / img.width
+        new_size = (max_width, int(img.height * ratio))
+        img = img.resize(new_size, Image.LANCZOS)
+    
+    return img
+
+def is_web_ready_jpeg(src_path, max_width=1920):
+    """True when src is already an upright RGB JPEG no wider than max_width (reads the header only).
+    
+    Photos with an EXIF rotation are not web-ready: the copy drops the EXIF
+    segment, so their pixels must be turned upright by a re-encode.
+    """
+    if os.path.splitext(src_path)[1].lower() not in PHOTO_EXTENSIONS:
+        return False
+    try:
+        with Image.open(src_path) as img:
+            return (img.format == 'JPEG' and img.mode == 'RGB' and img.width <= max_width
+                    and img.getexif().get(EXIF_ORIENTATION, 1) == 1)
+    except Exception:
+        return False
+
+def optimize_image(src_path, dest_path, max_width=1920, quality=85, keep_icc=False,
+                   keep_original=False):
+    """Optimize image for web with size and quality adjustments.
+    
+    With keep_original, JPEGs already within max_width are copied (minus
+    metadata) instead of re-encoded at quality.
+    """
+    if not PILLOW_AVAILABLE:
+        # Fallback to simple copy if Pillow not available
+        copy_file(src_path, dest_path)
+        return
+    
+    try:
+        # Already-resized uploads are copied (minus metadata) instead of re-encoded
+        if keep_original and is_web_ready_jpeg(src_path, max_width):
+            try:
+                copy_jpeg_without_metadata(src_path, dest_path, keep_icc=keep_icc)
+                return
+            except ValueError:
+                pass  # Unparseable header: re-encode below rather than copy metadata through
+        
+        img = load_web_image(src_path, max_width)
+        icc_profile = source_icc_profile(src_path) if keep_icc else None
         
         # Save optimized
-        img.save(dest_path, 'JPEG', quality=quality, optimize=True, progressive=True)
+        save_jpeg(img, dest_path, quality, progressive=True, icc_profile=icc_profile)
     except Exception as e:
-        print(f"  Warning: Could not optimize {src_path.name}: {e}")
-        shutil.copy2(src_path, dest_path)
+        print(f"  Warning: Could not optimize {os.path.basename(src_path)}: {e}")
+        copy_file(src_path, dest_path)
+
+# Gallery cells are 4:3 and up to ~350 CSS px wide (object-fit: cover), so
+# thumbnails cover twice that to stay sharp on high-density screens
+THUMB_SIZE = (800, 600)
+
+def thumbnail_cover_size(size, box=THUMB_SIZE):
+    """Smallest same-aspect size covering box (never larger than size itself)."""
+    width, height = size
+    scale = max(box[0] / width, box[1] / height)
+    if scale >= 1:
+        return size
+    return (max(1, round(width * scale)), max(1, round(height * scale)))
+
+def process_image_pair(src_path, large_dest, thumb_dest, max_width=1920, quality=85,
+                       thumb_size=THUMB_SIZE, keep_icc=False, keep_original=False, avif=False,
+                       webp=True):
+    """Write the optimized photo and its gallery thumbnail from a single decode."""
+    if not PILLOW_AVAILABLE:
+        # Fallback to simple copies if Pillow not available
+        copy_file(src_path, large_dest)
+        copy_file(src_path, thumb_dest)
+        return
+    
+    try:
+        img = load_web_image(src_path, max_width)
+        icc_profile = source_icc_profile(src_path) if keep_icc else None
+        # Already-resized uploads keep their image data if asked; only the thumbnail is encoded
+        kept = False
+        if keep_original and is_web_ready_jpeg(src_path, max_width):
+            try:
+                copy_jpeg_without_metadata(src_path, large_dest, keep_icc=keep_icc)
+                kept = True
+            except ValueError:
+                pass  # Unparseable header: re-encode rather than copy metadata through
+        if not kept:
+            save_jpeg(img, large_dest, quality, progressive=True, icc_profile=icc_profile)
+        
+        # The thumbnail is cut from the already-decoded, already-shrunk image
+        thumb = img.copy()
+        thumb.thumbnail(thumbnail_cover_size(img.size, thumb_size), Image.LANCZOS)
+        save_jpeg(thumb, thumb_dest, 80, icc_profile=icc_profile)
+        
+        # Smaller WebP/AVIF copies reuse the same decoded pixels
+        for extension, fmt, _mime, options in available_web_formats(avif, webp):
+            img.save(web_variant_path(large_dest, extension), fmt, quality=quality,
+                     icc_profile=icc_profile, **options)
+            thumb.save(web_variant_path(thumb_dest, extension), fmt, quality=80,
+                       icc_profile=icc_profile, **options)
+    except Exception as e:
+        print(f"  Warning: Could not optimize {os.path.basename(src_path)}: {e}")
+        copy_file(src_path, large_dest)
+        copy_file(src_path, thumb_dest)
+        # Never leave a variant behind that no longer matches the JPEG
+        for extension, _fmt, _mime, _options in available_web_formats(avif, webp):
+            for dest in (large_dest, thumb_dest):
+                try:
+                    os.unlink(web_variant_path(dest, extension))
+                except FileNotFoundError:
+                    pass
 
-def create_thumbnail(src_path, dest_path, size=(400, 300)):
+def create_thumbnail(src_path, dest_path, size=THUMB_SIZE):
     """Create thumbnail for gallery grid."""
     if not PILLOW_AVAILABLE:
         # Use full image if Pillow not available
-        shutil.copy2(src_path, dest_path)
+        copy_file(src_path, dest_path)
         return
     
     try:
-        img = Image.open(src_path)
+        img = ImageOps.exif_transpose(Image.open(src_path))
         
         # Convert RGBA to RGB if needed
-        if img.mode in ('RGBA', 'LA', 'P'):
-            bg = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'RGBA':
-                bg.paste(img, mask=img.split()[-1])
-            else:
-                bg.paste(img)
-            img = bg
+        img = flatten_to_rgb(img)
         
-        img.thumbnail(size, Image.LANCZOS)
-        img.save(dest_path, 'JPEG', quality=80, optimize=True)
+        img.thumbnail(thumbnail_cover_size(img.size, size), Image.LANCZOS)
+        save_jpeg(img, dest_path, 80)
     except Exception as e:
-        print(f"  Warning: Could not create thumbnail for {src_path.name}: {e}")
-        shutil.copy2(src_path, dest_path)
+        print(f"  Warning: Could not create thumbnail for {os.path.basename(src_path)}: {e}")
+        copy_file(src_path, dest_path)
+
+# photos_dir -> (subdirectory names, directory mtimes, folders) from the last scan
+_PHOTO_SCAN_CACHE: Dict[
+    str, Tuple[List[str], Optional[Tuple[int, ...]], Dict[str, List[Path]]]
+] = {}
+
+def _scan_signature(photos_dir, subdir_names):
+    """mtime_ns of photos_dir and each known subdirectory; None if any is gone."""
+    try:
+        return tuple(
+            os.stat(os.path.join(photos_dir, name)).st_mtime_ns
+            for name in ("", *subdir_names)
+        )
+    except OSError:
+        return None
+
+def scan_photo_folders(photos_dir, cache=True):
+    """Scan for photos in root and subdirectories.
+    
+    Results are reused while the mtimes of photos_dir and its subdirectories
+    are unchanged (e.g. wizard scan followed by build_site); pass cache=False
+    to force a fresh scan. Callers get their own copies of the lists.
+    """
+    key = os.fspath(photos_dir)
+    cached = _PHOTO_SCAN_CACHE.get(key) if cache else None
+    if cached is not None:
+        subdir_names, signature, folders = cached
+        if _scan_signature(key, subdir_names) == signature:
+            return {name: list(photos) for name, photos in folders.items()}
+    
+    folders, subdir_names = _scan_photo_folders(photos_dir)
+    _PHOTO_SCAN_CACHE[key] = (subdir_names, _scan_signature(key, subdir_names), folders)
+    return {name: list(photos) for name, photos in folders.items()}
 
-def scan_photo_folders(photos_dir):
-    """Scan for photos in root and subdirectories."""
+def _scan_photo_folders(photos_dir):
+    """Walk photos_dir once; return (folders, names of every subdirectory seen)."""
     folders = {}
     all_photos = []
-    
-    # Check for photos in root level
-    for ext in ["*.jpg", "*.jpeg", "*.JPG", "*.JPEG"]:
-        root_photos = list(photos_dir.glob(ext))
-        # Filter out hero.jpg and agent.jpg
-        root_photos = [p for p in root_photos if p.name.lower() not in ['hero.jpg', 'agent.jpg']]
-        all_photos.extend(root_photos)
+    root_photos = []
+    subdirs = []
+    
+    # One directory read per folder; suffixes are matched case-insensitively
+    with os.scandir(photos_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                subdirs.append(entry)
+                continue
+            name = entry.name.lower()
+            # Filter out hero.jpg and agent.jpg
+            if name.endswith(PHOTO_EXTENSIONS) and name not in EXCLUDED_PHOTOS and entry.is_file():
+                root_photos.append(Path(entry.path))
     
     if root_photos:
         folders["_root"] = root_photos
+        all_photos.extend(root_photos)
     
     # Check subdirectories
-    for subdir in photos_dir.iterdir():
-        if subdir.is_dir():
-            sub_photos = []
-            for ext in ["*.jpg", "*.jpeg", "*.JPG", "*.JPEG"]:
-                sub_photos.extend(subdir.glob(ext))
-            
-            if sub_photos:
-                folders[subdir.name] = sub_photos
-                all_photos.extend(sub_photos)
+    for subdir in subdirs:
+        with os.scandir(subdir.path) as entries:
+            sub_photos = [Path(entry.path) for entry in entries
+                          if entry.name.lower().endswith(PHOTO_EXTENSIONS) and entry.is_file()]
+        
+        if sub_photos:
+            folders[subdir.name] = sub_photos
+            all_photos.extend(sub_photos)
     
     # Always include "all" if we have any photos
     if all_photos:
         folders["all"] = all_photos
     
-    return folders
+    return folders, [subdir.name for subdir in subdirs]
 
-def check_netlify_cli():
-    """Check if Netlify CLI is installed."""
-    try:
-        result = subprocess.run(["netlify", "--version"], capture_output=True, text=True)
-        return result.returncode == 0
-    except FileNotFoundError:
-        return False
+async def _spawn_netlify(*args, cwd=None, stdin=False):
+    """Start a netlify CLI command without waiting for it.
+    
+    Without piped input the command gets /dev/null, never the terminal: its
+    output is captured, so a prompt would be invisible, and a background
+    command must not compete with the wizard for keystrokes.
+    """
+    import asyncio
+    
+    return await asyncio.create_subprocess_exec(
+        "netlify", *args,
+        stdin=asyncio.subprocess.PIPE if stdin else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd
+    )
 
-def get_netlify_sites():
-    """Get list of user's Netlify sites."""
-    try:
-        result = subprocess.run(
-            ["netlify", "sites:list", "--json"],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0:
-            sites = json.loads(result.stdout)
-            return sites
+async def _collect_netlify(proc, input=None):
+    """Wait for a started netlify command and return it as a CompletedProcess."""
+    stdout, stderr = await proc.communicate(input.encode() if input is not None else None)
+    return subprocess.CompletedProcess(
+        ["netlify"], proc.returncode,
+        stdout.decode(errors="replace"), stderr.decode(errors="replace")
+    )
+
+async def _run_netlify(*args, cwd=None, input=None):
+    """Run a netlify CLI command (the async counterpart of subprocess.run)."""
+    proc = await _spawn_netlify(*args, cwd=cwd, stdin=input is not None)
+    return await _collect_netlify(proc, input)
+
+async def _parse_netlify_sites(proc):
+    """Wait for a started `netlify sites:list --json` and return its sites ([] on failure)."""
+    result = await _collect_netlify(proc)
+    if result.returncode != 0:
         return []
-    except:
+    try:
+        return _json_loads(result.stdout)
+    except (ValueError, TypeError):
         return []
 
+@functools.lru_cache(maxsize=1)
+def check_netlify_cli():
+    """Check if Netlify CLI is installed (a PATH lookup; no Node start-up)."""
+    return shutil.which("netlify") is not None
+
 def handle_netlify_deployment(property_path, dist_path, folder_name):
     """Handle Netlify deployment with site tracking."""
-    # Check if Netlify CLI is installed
-    if not check_netlify_cli():
-        print("\n⚠️  Netlify CLI not found")
-        print("To enable deployment, install it with: npm install -g netlify-cli")
-        return
+    # Imported here: asyncio costs ~40 ms at start-up and only deployment uses it
+    import asyncio
+    
+    asyncio.run(_handle_netlify_deployment(property_path, dist_path, folder_name))
+
+async def _handle_netlify_deployment(property_path, dist_path, folder_name):
+    import asyncio
     
     # Check for existing deployment
     netlify_dir = property_path / ".netlify"
@@ -151,24 +690,30 @@ def handle_netlify_deployment(property_path, dist_path, folder_name):
     existing_site_id = None
     existing_site_url = None
     
-    if netlify_state.exists():
+    if os.path.exists(netlify_state):
         try:
-            with open(netlify_state, 'r') as f:
-                state = json.load(f)
+            with open(netlify_state, 'rb') as f:
+                state = _json_loads(f.read())
                 existing_site_id = state.get("siteId")
-                # Try to get site info
-                if existing_site_id:
-                    result = subprocess.run(
-                        ["netlify", "api", f"getSite", "--data", f'{{"site_id":"{existing_site_id}"}}'],
-                        capture_output=True,
-                        text=True
-                    )
-                    if result.returncode == 0:
-                        site_info = json.loads(result.stdout)
-                        existing_site_url = site_info.get("url") or site_info.get("ssl_url")
-                    else:
-                        # Site might have been deleted
-                        existing_site_id = None
+        except:
+            existing_site_id = None
+    
+    # Check if Netlify CLI is installed
+    if not check_netlify_cli():
+        print("\n⚠️  Netlify CLI not found")
+        print("To enable deployment, install it with: npm install -g netlify-cli")
+        return
+    
+    if existing_site_id:
+        try:
+            # Try to get site info
+            result = await _run_netlify("api", "getSite", "--data", json.dumps({"site_id": existing_site_id}))
+            if result.returncode == 0:
+                site_info = _json_loads(result.stdout)
+                existing_site_url = site_info.get("url") or site_info.get("ssl_url")
+            else:
+                # Site might have been deleted
+                existing_site_id = None
         except:
             existing_site_id = None
     
@@ -185,12 +730,12 @@ def handle_netlify_deployment(property_path, dist_path, folder_name):
         
         if update.lower() == 'y':
             print("\nDeploying to Netlify...")
-            result = subprocess.run([
-                "netlify", "deploy",
+            result = await _run_netlify(
+                "deploy",
                 "--dir", str(dist_path),
                 "--site", existing_site_id,
                 "--prod"
-            ], capture_output=True, text=True)
+            )
             
             if result.returncode == 0:
                 print("✓ Site updated successfully!")
@@ -211,25 +756,44 @@ def handle_netlify_deployment(property_path, dist_path, folder_name):
     print("  3. Link to existing site")
     print("  4. Skip deployment")
     
-    choice = prompt_optional("Choice", "4")
+    # Fetch the site list while the user is choosing, in case they pick option 3
+    try:
+        sites_proc = await _spawn_netlify("sites:list", "--json")
+    except OSError:
+        sites_proc = None
+    
+    # Prompt on the main thread so Ctrl-C exits at once; sites:list keeps
+    # running meanwhile and its output is read after the choice is made
+    choice = None
+    try:
+        choice = prompt_optional("Choice", "4")
+    finally:
+        if sites_proc and choice != "3":
+            if sites_proc.returncode is None:
+                try:
+                    sites_proc.kill()
+                except ProcessLookupError:
+                    pass
+            await sites_proc.wait()
     
     if choice == "1":
         # Create new site with auto-generated name
         print("\nCreating new Netlify site...")
         
         # First initialize the site
-        result = subprocess.run([
-            "netlify", "init",
+        result = await _run_netlify(
+            "init",
             "--manual",
-            "--dir", str(dist_path)
-        ], capture_output=True, text=True, input="n\n")
+            "--dir", str(dist_path),
+            input="n\n"
+        )
         
         # Deploy to new site
-        result = subprocess.run([
-            "netlify", "deploy",
+        result = await _run_netlify(
+            "deploy",
             "--dir", str(dist_path),
             "--prod"
-        ], capture_output=True, text=True)
+        )
         
         if result.returncode == 0:
             print("✓ Site deployed successfully!")
@@ -247,14 +811,15 @@ def handle_netlify_deployment(property_path, dist_path, folder_name):
             
             # Try to get site ID from netlify status
             if not site_id:
-                status_result = subprocess.run([
-                    "netlify", "status",
-                    "--json"
-                ], capture_output=True, text=True, cwd=dist_path)
+                status_result = await _run_netlify(
+                    "status",
+                    "--json",
+                    cwd=dist_path
+                )
                 
                 if status_result.returncode == 0:
                     try:
-                        status = json.loads(status_result.stdout)
+                        status = _json_loads(status_result.stdout)
                         site_id = status.get("siteId")
                     except:
                         pass
@@ -274,10 +839,10 @@ def handle_netlify_deployment(property_path, dist_path, folder_name):
         print(f"\nCreating site: {custom_name}.netlify.app...")
         
         # Create site with name
-        result = subprocess.run([
-            "netlify", "sites:create",
+        result = await _run_netlify(
+            "sites:create",
             "--name", custom_name
-        ], capture_output=True, text=True)
+        )
         
         if result.returncode == 0:
             # Extract site ID
@@ -290,7 +855,7 @@ def handle_netlify_deployment(property_path, dist_path, folder_name):
             if not site_id:
                 # Try to parse JSON output
                 try:
-                    site_info = json.loads(result.stdout)
+                    site_info = _json_loads(result.stdout)
                     site_id = site_info.get("id") or site_info.get("site_id")
                 except:
                     pass
@@ -298,12 +863,12 @@ def handle_netlify_deployment(property_path, dist_path, folder_name):
             if site_id:
                 # Deploy to the created site
                 print("Deploying content...")
-                deploy_result = subprocess.run([
-                    "netlify", "deploy",
+                deploy_result = await _run_netlify(
+                    "deploy",
                     "--dir", str(dist_path),
                     "--site", site_id,
                     "--prod"
-                ], capture_output=True, text=True)
+                )
                 
                 if deploy_result.returncode == 0:
                     print(f"✓ Site deployed successfully!")
@@ -323,7 +888,7 @@ def handle_netlify_deployment(property_path, dist_path, folder_name):
     elif choice == "3":
         # Link to existing site
         print("\nFetching your Netlify sites...")
-        sites = get_netlify_sites()
+        sites = await _parse_netlify_sites(sites_proc) if sites_proc else []
         
         if not sites:
             print("No existing sites found or unable to fetch sites")
@@ -347,12 +912,12 @@ def handle_netlify_deployment(property_path, dist_path, folder_name):
                 if site_id:
                     print(f"\nDeploying to {selected_site.get('name')}...")
                     
-                    result = subprocess.run([
-                        "netlify", "deploy",
+                    result = await _run_netlify(
+                        "deploy",
                         "--dir", str(dist_path),
                         "--site", site_id,
                         "--prod"
-                    ], capture_output=True, text=True)
+                    )
                     
                     if result.returncode == 0:
                         print("✓ Site deployed successfully!")
@@ -370,15 +935,21 @@ def save_netlify_state(property_path, site_id):
     state = {"siteId": site_id}
     
     state_file = netlify_dir / "state.json"
-    with open(state_file, 'w') as f:
-        json.dump(state, f, indent=2)
+    with open(state_file, 'wb') as f:
+        f.write(_json_dumps(state))
     
     # Also add .netlify to gitignore if it exists
     gitignore = property_path / ".gitignore"
-    if not gitignore.exists():
+    if not os.path.exists(gitignore):
         with open(gitignore, 'w') as f:
             f.write(".netlify\n")
 
+def menu_choice(options, choice):
+    """Pick options[n - 1] for a menu answer "n", falling back to the first option."""
+    if choice.isdecimal() and 1 <= int(choice) <= len(options):
+        return options[int(choice) - 1]
+    return options[0]
+
 def prompt_optional(prompt_text, default=None):
     """Prompt for optional input, return None if empty."""
     if default:
@@ -402,8 +973,21 @@ def prompt_number(prompt_text):
         print(f"  Warning: Invalid number, skipping field")
         return None
 
-def wizard_mode():
-    """Interactive wizard to create listing.json and build site."""
+def _prepare_output_dir(path):
+    """Create path and any missing parents; return the folders created, innermost first."""
+    created = []
+    missing = Path(path)
+    while not os.path.isdir(missing):
+        created.append(missing)
+        missing = missing.parent
+    os.makedirs(path, exist_ok=True)
+    return created
+
+def wizard_mode(offer_deploy=True):
+    """Interactive wizard to create listing.json and build site.
+    
+    offer_deploy=False leaves out the Netlify deployment prompt (site_no_deploy.py).
+    """
     print("\n" + "="*60)
     print("REAL ESTATE TOUR GENERATOR - INTERACTIVE WIZARD")
     print("="*60)
@@ -417,14 +1001,14 @@ def wizard_mode():
     property_path = ROOT_DIR / folder_name
     
     # Check if folder exists
-    if not property_path.exists():
+    if not os.path.exists(property_path):
         print(f"Error: Folder '{folder_name}' not found in {ROOT_DIR}")
         print(f"Please create the folder and add photos before running wizard")
         sys.exit(1)
     
     # Check for photos
     photos_dir = property_path / "photos"
-    if not photos_dir.exists():
+    if not os.path.exists(photos_dir):
         print(f"Error: No photos/ subfolder found in {folder_name}")
         print(f"Please create {folder_name}/photos/ and add photos")
         sys.exit(1)
@@ -467,8 +1051,8 @@ def wizard_mode():
         print(f"✓ Found {total_photos} photos in photos/ folder")
     
     # Check for special images
-    hero_exists = (property_path / "hero.jpg").exists()
-    agent_exists = (property_path / "agent.jpg").exists()
+    hero_exists = os.path.exists(property_path / "hero.jpg")
+    agent_exists = os.path.exists(property_path / "agent.jpg")
     
     # Handle hero image selection
     hero_selected = None
@@ -489,7 +1073,8 @@ def wizard_mode():
             if hero_choice == "2":
                 # Show numbered list of photos
                 print("\nSelect photo for hero:")
-                all_photos = photo_folders.get("all", [])
+                # Same order as the gallery built from collect_photos()
+                all_photos = sorted(photo_folders.get("all", []), key=lambda p: natural_sort_key(str(p)))
                 for i, photo in enumerate(all_photos[:20], 1):  # Limit to first 20 for usability
                     # Show relative path from photos dir
                     rel_path = photo.relative_to(photos_dir)
@@ -619,13 +1204,14 @@ def wizard_mode():
     if listing.get("address") and listing["address"] != "Address Not Provided":
         seo["title"] = f"{listing['title']} - {listing['address']}"
     
-    seo["description"] = f"Property listing"
-    if details.get("beds") and details["beds"] > 0:
-        seo["description"] = f"{details['beds']} bed"
+    # Assemble the description from parts and join once
+    parts = [f"{details['beds']} bed" if details.get("beds") and details["beds"] > 0 else "Property listing"]
     if details.get("baths") and details["baths"] > 0:
-        seo["description"] += f", {details['baths']} bath"
+        parts.append(f"{details['baths']} bath")
+    description = ", ".join(parts)
     if listing.get("address") and listing["address"] != "Address Not Provided":
-        seo["description"] += f" property at {listing['address']}"
+        description = f"{description} property at {listing['address']}"
+    seo["description"] = description
     
     listing["seo"] = seo
     
@@ -640,12 +1226,7 @@ def wizard_mode():
     print("  3. Modern Light")
     theme_choice = prompt_optional("Choice", "1")
     
-    theme_map = {
-        "1": "classic-light",
-        "2": "luxury-dark",
-        "3": "modern-light"
-    }
-    theme = theme_map.get(theme_choice, "classic-light")
+    theme = menu_choice(THEMES, theme_choice)
     listing["theme"] = {"scheme": theme}
     
     print("\nSelect Hero Style:")
@@ -654,12 +1235,7 @@ def wizard_mode():
     print("  3. Video Hero (coming soon)")
     hero_choice = prompt_optional("Choice", "1")
     
-    hero_map = {
-        "1": "single",
-        "2": "slider",
-        "3": "video"
-    }
-    hero_style = hero_map.get(hero_choice, "single")
+    hero_style = menu_choice(HERO_STYLES, hero_choice)
     listing["hero"] = {"style": hero_style}
     
     # Handle hero image
@@ -675,16 +1251,36 @@ def wizard_mode():
     
     # Save listing.json
     listing_path = property_path / "listing.json"
-    with open(listing_path, 'w') as f:
-        json.dump(listing, f, indent=2)
+    listing_path.write_bytes(_json_dumps(listing))
     
     print(f"\n✓ Created: {folder_name}/listing.json")
     
+    # Create dist/<folder> in the background while the build question is
+    # answered; mkdir latency on network filesystems then overlaps user input
+    output_path = ROOT_DIR / "dist" / folder_name
+    prep_executor = ThreadPoolExecutor(max_workers=1)
+    output_prep = prep_executor.submit(_prepare_output_dir, output_path)
+    prep_executor.shutdown(wait=False)
+    
     # Ask to generate site
-    generate = prompt_optional("\nGenerate site now? (y/n)", "y")
+    generate = None
+    try:
+        generate = prompt_optional("\nGenerate site now? (y/n)", "y")
+    finally:
+        try:
+            created = output_prep.result()
+        except OSError:
+            created = []  # build_site creates the folder again and reports the error
+        if generate is None or generate.lower() != 'y':
+            # Declined or cancelled (Ctrl-C/EOF): no empty folders left behind
+            for directory in created:
+                try:
+                    os.rmdir(directory)
+                except OSError:
+                    break
+    
     if generate.lower() == 'y':
         print(f"✓ Building site...")
-        output_path = ROOT_DIR / "dist" / folder_name
         build_site(property_path, output_path, hero_exists=hero_exists)
         print(f"✓ Site ready at: dist/{folder_name}/index.html")
         
@@ -695,9 +1291,10 @@ def wizard_mode():
             webbrowser.open(f"file://{output_path}/index.html")
         
         # Offer Netlify deployment
-        deploy = prompt_optional("\nDeploy to Netlify? (y/n)", "n")
-        if deploy.lower() == 'y':
-            handle_netlify_deployment(property_path, output_path, folder_name)
+        if offer_deploy:
+            deploy = prompt_optional("\nDeploy to Netlify? (y/n)", "n")
+            if deploy.lower() == 'y':
+                handle_netlify_deployment(property_path, output_path, folder_name)
     else:
         print(f"\nTo build later, run:")
         print(f"  python site.py build --input {folder_name} --output dist/{folder_name}")
@@ -706,38 +1303,54 @@ def load_listing_data(input_path, required_validation=True):
     """Load and validate listing.json from input directory."""
     listing_file = Path(input_path) / "listing.json"
     
-    if not listing_file.exists():
-        print(f"Error: listing.json not found in {input_path}")
-        sys.exit(1)
+    if not os.path.exists(listing_file):
+        raise ListingError(f"listing.json not found in {input_path}")
+    
+    with open(listing_file, 'rb') as f:
+        data = _json_loads(f.read())
     
-    with open(listing_file, 'r') as f:
-        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ListingError("listing.json must contain a JSON object")
     
-    # Only validate required fields if not from wizard
+    # Wizard-written files always fill these fields (with defaults if skipped).
+    # Set differences run in C and report every missing field in one message.
     if required_validation:
-        # For wizard-generated files, we use defaults so skip validation
-        pass
+        missing = sorted(REQUIRED_LISTING_FIELDS.difference(data))
+        details = data.get("details")
+        if isinstance(details, dict):
+            missing += sorted(f"details.{k}" for k in REQUIRED_DETAIL_FIELDS.difference(details))
+        elif "details" in data:
+            raise ListingError("listing.json field 'details' must be an object")
+        if missing:
+            raise ListingError(f"listing.json is missing required fields: {', '.join(missing)}")
     
     return data
 
+_DIGIT_RUNS = re.compile(r'(\d+)')
+
+def natural_sort_key(text):
+    """Sort key that orders 'photo_9.jpg' before 'photo_10.jpg'."""
+    parts = _DIGIT_RUNS.split(text.casefold())
+    # re.split puts the digit runs at the odd indexes
+    parts[1::2] = map(int, parts[1::2])
+    return parts, text
+
 def collect_photos(input_path, return_dict=True):
     """Collect all jpg/jpeg files from photos directory and subdirectories."""
     photos_dir = Path(input_path) / "photos"
     
-    if not photos_dir.exists():
-        print(f"Error: photos directory not found in {input_path}")
-        sys.exit(1)
+    if not os.path.exists(photos_dir):
+        raise ListingError(f"photos directory not found in {input_path}")
     
     # Use scan_photo_folders to get all photos
     photo_folders = scan_photo_folders(photos_dir)
     
     if not photo_folders.get("all"):
-        print(f"Error: No photos found in {photos_dir}")
-        sys.exit(1)
+        raise ListingError(f"No photos found in {photos_dir}")
     
     # Return photos with their relative paths from photos dir
     all_photos = photo_folders["all"]
-    all_photos.sort(key=lambda p: str(p))
+    all_photos.sort(key=lambda p: natural_sort_key(str(p)))
     
     if not return_dict:
         # Simple backward compatibility mode
@@ -761,111 +1374,452 @@ def collect_photos(input_path, return_dict=True):
     
     return photo_data
 
-def process_image(src_path, dest_path, thumbnail=False):
+def process_image(src_path, dest_path, thumbnail=False, keep_icc=False, keep_original=False):
     """
     Process and copy image to destination with optimization.
     """
     if thumbnail:
         create_thumbnail(src_path, dest_path)
     else:
-        optimize_image(src_path, dest_path)
+        optimize_image(src_path, dest_path, keep_icc=keep_icc, keep_original=keep_original)
+
+class ImageTask(NamedTuple):
+    """One image for the worker pool.
+    
+    mode is "pair" for gallery photos (web image plus thumbnail) or
+    "optimize" for a single web image such as the hero or agent photo.
+    """
+    src: str
+    dest: str
+    thumb: Optional[str] = None
+    mode: str = "optimize"
+    keep_icc: bool = False
+    keep_original: bool = False
+    avif: bool = False
+    webp: bool = True
+
+def run_image_task(task):
+    """Process pool entry point: run a single ImageTask."""
+    if task.mode == "pair":
+        process_image_pair(task.src, task.dest, task.thumb, keep_icc=task.keep_icc,
+                           keep_original=task.keep_original, avif=task.avif,
+                           webp=task.webp)
+    else:
+        process_image(task.src, task.dest, keep_icc=task.keep_icc,
+                      keep_original=task.keep_original)
+
+def run_image_jobs(tasks, workers=None):
+    """Run ImageTasks across one worker process per CPU core (threads for plain copies).
+    
+    workers caps the process count (build-batch --jobs shares the cores
+    between listings). A source queued more than once in the same mode (e.g.
+    the agent photo doubling as hero.jpg) is decoded once; the other
+    destinations get copies.
+    """
+    unique = {}
+    duplicates = []
+    for task in tasks:
+        key = (os.fspath(task.src), task.mode)
+        if key in unique:
+            duplicates.append((unique[key], task))
+        else:
+            unique[key] = task
+    tasks = list(unique.values())
+    
+    if not PILLOW_AVAILABLE:
+        # Without Pillow every task is a plain copy, which releases the GIL in
+        # the kernel, so threads overlap the I/O without process start-up
+        with ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 1) * 2)) as executor:
+            list(executor.map(run_image_task, tasks))
+    else:
+        workers = min(workers or os.cpu_count() or 1, len(tasks))
+        if workers <= 1:
+            # Not worth the pool start-up cost
+            for task in tasks:
+                run_image_task(task)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(run_image_task, tasks, chunksize=4))
+    
+    for original, duplicate in duplicates:
+        copy_file(original.dest, duplicate.dest)
+        if duplicate.thumb:
+            copy_file(original.thumb, duplicate.thumb)
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def format_number(value):
+    """Format a number with thousands separators, memoized for batch builds."""
+    return format(value, ",")
+
+def format_price(price):
+    """Format a price as dollars with thousands separators."""
+    return "$" + format_number(price)
+
+# Incremental-build manifest written into each output directory
+MANIFEST_NAME = ".manifest.json"
+MANIFEST_VERSION = 3
+
+def load_build_manifest(output_path, options=None):
+    """Load source signatures recorded by the previous build of output_path.
+    
+    Returns {} when that build used different image options, so every
+    output is regenerated.
+    """
+    try:
+        with open(Path(output_path) / MANIFEST_NAME, 'rb') as f:
+            manifest = _json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    if manifest.get("options", {}) != (options or {}):
+        return {}
+    return manifest.get("files", {})
+
+def save_build_manifest(output_path, files, options=None):
+    """Record source signatures so the next build can skip unchanged files."""
+    with open(Path(output_path) / MANIFEST_NAME, 'wb') as f:
+        f.write(_json_dumps({"version": MANIFEST_VERSION, "options": options or {}, "files": files}))
+
+def source_signature(path):
+    """Return the (mtime_ns, size) signature used to detect changed source files."""
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+def content_hash(path):
+    """Hash a file's bytes, prefixed with the algorithm (BLAKE3 if installed, else BLAKE2b)."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            data = b""
+        else:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if BLAKE3_AVAILABLE:
+                return "blake3:" + blake3.blake3(data).hexdigest()
+            return "blake2b:" + hashlib.blake2b(data).hexdigest()
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+def output_is_current(previous_manifest, manifest, key, src, outputs):
+    """Record src's signature under key; True if the last build made outputs from the same src.
+    
+    Entries are [mtime_ns, size, hash]. A matching mtime and size is trusted
+    as is; a source touched without changing its bytes (a re-export, a
+    copy) still counts as unchanged when its content hash matches.
+    """
+    signature = source_signature(src)
+    previous = previous_manifest.get(key)
+    if isinstance(previous, list) and len(previous) == 3 and previous[:2] == signature:
+        manifest[key] = previous
+        unchanged = True
+    else:
+        manifest[key] = signature + [content_hash(src)]
+        unchanged = (isinstance(previous, list) and len(previous) == 3
+                     and previous[1] == signature[1] and previous[2] == manifest[key][2])
+    return unchanged and all(os.path.exists(path) for path in outputs)
+
+def remove_stale_files(directory, keep):
+    """Delete files under directory that are not in keep, then prune empty folders."""
+    removed = 0
+    for root, _dirs, files in os.walk(directory, topdown=False):
+        for name in files:
+            path = os.path.join(root, name)
+            if path not in keep:
+                os.unlink(path)
+                removed += 1
+        if root != os.fspath(directory) and not os.listdir(root):
+            os.rmdir(root)
+    return removed
+
+# Jinja2 environment and compiled listing template, created on first use and
+# reused by every later build in the same process
+_JINJA_ENV = None
+_LISTING_TEMPLATE = None
 
-def build_site(input_path, output_path, hero_exists=False):
-    """Build the static site from input listing to output directory."""
+def _compiled_template_is_fresh(name="listing.html"):
+    """Check that an ahead-of-time compiled template exists and is newer than its source."""
+    from jinja2 import ModuleLoader
+    
+    compiled = COMPILED_TEMPLATES_DIR / ModuleLoader.get_module_filename(name)
+    try:
+        return compiled.stat().st_mtime >= (TEMPLATES_DIR / name).stat().st_mtime
+    except OSError:
+        return False
+
+def _get_template():
+    """Return the compiled listing.html template, building the environment once."""
+    global _JINJA_ENV, _LISTING_TEMPLATE
+    if _LISTING_TEMPLATE is None:
+        if _JINJA_ENV is None:
+            # Imported lazily: --help, wizard prompts, etc. never pay Jinja2's import cost
+            from jinja2 import (
+                ChoiceLoader, Environment, FileSystemBytecodeCache, FileSystemLoader, ModuleLoader
+            )
+            
+            loader = FileSystemLoader(str(TEMPLATES_DIR))
+            # Prefer the precompiled Python module from `site.py compile-templates`,
+            # which skips Jinja's lexer/parser/codegen entirely
+            if _compiled_template_is_fresh():
+                loader = ChoiceLoader([ModuleLoader(str(COMPILED_TEMPLATES_DIR)), loader])
+            # Bytecode cached on disk lets new processes (batch workers, the next
+            # CLI run) skip compiling templates that have not changed
+            try:
+                os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(str(JINJA_CACHE_DIR))
+            except OSError:
+                bytecode_cache = None
+            # Only listing.html is ever rendered, so escaping is always on; a constant
+            # avoids select_autoescape's per-template filename dispatch
+            _JINJA_ENV = Environment(
+                loader=loader,
+                autoescape=True,
+                cache_size=10,
+                auto_reload=False,
+                optimized=True,
+                bytecode_cache=bytecode_cache
+            )
+        _LISTING_TEMPLATE = _JINJA_ENV.get_template("listing.html")
+    return _LISTING_TEMPLATE
+
+def compile_templates(target=COMPILED_TEMPLATES_DIR):
+    """Compile all templates ahead of time into importable Python modules."""
+    import compileall
+    from jinja2 import Environment, FileSystemLoader
+    
+    target = Path(target)
+    if os.path.exists(target):
+        shutil.rmtree(target)
+    target.mkdir(parents=True)
+    
+    env = Environment(loader=FileSystemLoader(str(TEMPLATES_DIR)), autoescape=True)
+    env.compile_templates(str(target), zip=None, ignore_errors=False)
+    
+    # Byte-compile the generated modules too so the first import is free
+    compileall.compile_dir(str(target), quiet=1)
+    
+    print(f"✓ Compiled templates to {target}")
+
+def build_site(input_path, output_path, hero_exists=False, link_static=False, keep_icc=False,
+               keep_original=False, avif=False, webp=True, workers=None):
+    """Build the static site from input listing to output directory.
+    
+    workers caps the image worker processes (default: one per CPU core).
+    """
     input_path = Path(input_path)
     output_path = Path(output_path)
     
     print(f"Building site from {input_path} to {output_path}")
     
     # Load listing data
-    listing = load_listing_data(input_path, required_validation=False)
+    listing = load_listing_data(input_path)
     photos = collect_photos(input_path)
     
-    # Clean and create output directory
-    if output_path.exists():
-        shutil.rmtree(output_path)
-    output_path.mkdir(parents=True, exist_ok=True)
-    
-    # Create subdirectories
-    (output_path / "photos").mkdir(exist_ok=True)
-    (output_path / "static").mkdir(exist_ok=True)
+    # Decide up front whether an agent photo will be copied so every output
+    # folder can be created in a single pass
+    agent = listing.get("agent") or {}
+    agent_photo_filename = agent.get("photo")
+    agent_photo_path = input_path / agent_photo_filename if agent_photo_filename else None
+    if agent_photo_path is None or not os.path.exists(agent_photo_path):
+        agent_photo_filename = None
+    
+    # Create output directory and subdirectories; existing output is reused so
+    # unchanged photos and assets are not rewritten (see .manifest.json)
+    output_dirs = [output_path, output_path / "photos", output_path / "thumbs", output_path / "static"]
+    if agent_photo_filename:
+        output_dirs.append(output_path / "agent")
+    for directory in output_dirs:
+        os.makedirs(directory, exist_ok=True)
+    
+    web_formats = [entry[0] for entry in available_web_formats(avif, webp)]
+    
+    # Images encoded with different options are never reused
+    image_options = {"keep_icc": keep_icc, "keep_original": keep_original,
+                     "thumb_size": list(THUMB_SIZE), "web_formats": web_formats}
+    previous_manifest = load_build_manifest(output_path, image_options)
+    manifest = {}
     
     # Copy and process photos
     print(f"Processing {len(photos)} photos...")
     
     # If PILLOW is available, show optimization message
     if PILLOW_AVAILABLE:
-        print("  Optimizing images for web...")
+        print("  Optimizing images for web..." + (" (using Pillow-SIMD)" if PILLOW_SIMD else ""))
+    
+    # Plain string prefixes avoid building Path objects per photo
+    src_dir = os.fspath(input_path / "photos") + os.sep
+    dest_dir = os.fspath(output_path / "photos") + os.sep
+    thumb_dir = os.fspath(output_path / "thumbs") + os.sep
     
+    if "avif" in web_formats:
+        print("  Writing AVIF variants (much slower to encode than JPEG/WebP)")
+    
+    photo_tasks = []
+    photo_outputs = set()
+    job_dirs = set()
     for photo_info in photos:
         photo_path = photo_info["filename"] if isinstance(photo_info, dict) else photo_info
-        src = input_path / "photos" / photo_path
-        dest_path = output_path / "photos" / photo_path
+        src = src_dir + photo_path
+        dest_path = dest_dir + photo_path
+        thumb_path = thumb_dir + photo_path
+        outputs = [dest_path, thumb_path]
+        for extension in web_formats:
+            outputs.append(web_variant_path(dest_path, extension))
+            outputs.append(web_variant_path(thumb_path, extension))
+        photo_outputs.update(outputs)
+        if isinstance(photo_info, dict):
+            photo_info["thumbnail"] = f"thumbs/{photo_path}"
+        
+        # Skip photos whose source is unchanged since the last build
+        if output_is_current(previous_manifest, manifest, f"photos/{photo_path}", src, outputs):
+            continue
         
-        # Create subdirectory if photo is in a folder
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        # Subdirectories are created once per folder below, not once per photo
+        job_dirs.add(os.path.dirname(dest_path))
+        job_dirs.add(os.path.dirname(thumb_path))
         
-        process_image(src, dest_path)
+        # Full-size photo and gallery thumbnail share one decode
+        photo_tasks.append(ImageTask(src, dest_path, thumb_path, mode="pair", keep_icc=keep_icc,
+                                     keep_original=keep_original, avif=avif, webp=webp))
+    
+    if len(photo_tasks) < len(photos):
+        print(f"  Skipping {len(photos) - len(photo_tasks)} unchanged photos")
+    
+    # Drop outputs of photos that were removed or renamed since the last build
+    removed = remove_stale_files(output_path / "photos", photo_outputs)
+    remove_stale_files(output_path / "thumbs", photo_outputs)
+    if removed:
+        print(f"  Removed {removed} stale photo files")
+    
+    # Create category subdirectories serially, before workers start (and after
+    # stale pruning, which removes empty directories)
+    for directory in job_dirs:
+        os.makedirs(directory, exist_ok=True)
+    
+    # Hero and agent images join the gallery photos in a single worker pool
+    image_tasks = list(photo_tasks)
     
     # Handle hero image
     hero_image = None
+    hero_src = input_path / "hero.jpg"
+    hero_dest = os.fspath(output_path / "hero.jpg")
     
     # Check if hero is specified in listing
     if listing.get("hero", {}).get("image"):
         hero_spec = listing["hero"]["image"]
         if hero_spec == "hero.jpg":
-            hero_src = input_path / "hero.jpg"
-            if hero_src.exists():
-                hero_dest = output_path / "hero.jpg"
-                process_image(hero_src, hero_dest)
+            if os.path.exists(hero_src):
                 hero_image = "hero.jpg"
-                print("Processing hero.jpg")
         else:
             # Hero is a photo from the gallery
             hero_image = f"photos/{hero_spec}"
     else:
         # Fallback: check for hero.jpg or use first photo
-        hero_src = input_path / "hero.jpg"
-        if hero_src.exists():
-            hero_dest = output_path / "hero.jpg"
-            process_image(hero_src, hero_dest)
+        if os.path.exists(hero_src):
             hero_image = "hero.jpg"
-            print("Processing hero.jpg")
         elif photos:
             # Use first photo as hero
             first_photo = photos[0]["filename"] if isinstance(photos[0], dict) else photos[0]
             hero_image = f"photos/{first_photo}"
     
+    if hero_image == "hero.jpg":
+        if not output_is_current(previous_manifest, manifest, "hero.jpg", hero_src, [hero_dest]):
+            image_tasks.append(ImageTask(os.fspath(hero_src), hero_dest, keep_icc=keep_icc,
+                                         keep_original=keep_original))
+            print("Processing hero.jpg")
+    elif os.path.exists(hero_dest):
+        # hero.jpg was removed from the listing since the last build
+        os.unlink(hero_dest)
+    
     # Process agent photo if it exists
-    agent_photo_filename = None
-    if listing.get("agent", {}).get("photo"):
-        agent_photo_path = input_path / listing["agent"]["photo"]
-        if agent_photo_path.exists():
-            agent_photo_filename = listing["agent"]["photo"]
-            # Create agent subdirectory if needed
-            (output_path / "agent").mkdir(exist_ok=True)
-            dest = output_path / "agent" / agent_photo_filename
-            process_image(agent_photo_path, dest)
+    agent_outputs = set()
+    if agent_photo_filename:
+        dest = os.fspath(output_path / "agent" / agent_photo_filename)
+        agent_outputs.add(dest)
+        if not output_is_current(previous_manifest, manifest, f"agent/{agent_photo_filename}",
+                                 agent_photo_path, [dest]):
+            image_tasks.append(ImageTask(os.fspath(agent_photo_path), dest, keep_icc=keep_icc,
+                                         keep_original=keep_original))
             print(f"Processing agent photo: {agent_photo_filename}")
+    if os.path.isdir(output_path / "agent"):
+        remove_stale_files(output_path / "agent", agent_outputs)
+    
+    # Decode/resize/encode is CPU-bound, so use processes to get past the GIL
+    run_image_jobs(image_tasks, workers)
+    
+    # Report what re-encoding and metadata stripping saved on this run's photos
+    if photo_tasks:
+        source_bytes = sum(os.path.getsize(task.src) for task in photo_tasks)
+        output_bytes = sum(os.path.getsize(task.dest) for task in photo_tasks)
+        print(f"  Photo JPEGs: {source_bytes / 1e6:.1f} MB -> {output_bytes / 1e6:.1f} MB")
+    
+    # Offer WebP/AVIF through <picture> only where both variants were written
+    for photo_info in photos:
+        if not isinstance(photo_info, dict):
+            continue
+        photo_path = photo_info["filename"]
+        photo_info["sources"] = [
+            {
+                "format": extension,
+                "type": mime,
+                "srcset": web_variant_path(f"thumbs/{photo_path}", extension),
+                "full": web_variant_path(f"photos/{photo_path}", extension),
+            }
+            for extension, _fmt, mime, _options in available_web_formats(avif, webp)
+            if os.path.exists(web_variant_path(dest_dir + photo_path, extension))
+            and os.path.exists(web_variant_path(thumb_dir + photo_path, extension))
+        ]
     
     # Copy static assets (CSS, JS including lightbox)
-    if STATIC_DIR.exists():
-        for item in STATIC_DIR.iterdir():
-            if item.is_file():
-                shutil.copy2(item, output_path / "static" / item.name)
+    if os.path.exists(STATIC_DIR):
+        # DirEntry.is_file() reuses the file type from readdir, no stat per entry
+        static_dest = os.fspath(output_path / "static") + os.sep
+        with os.scandir(STATIC_DIR) as it:
+            static_files = [entry for entry in it if entry.is_file()]
+        # Linked and copied assets get separate keys, so toggling --link-static reinstalls them
+        static_prefix = "static-linked" if link_static else "static"
+        changed_static = [
+            entry for entry in static_files
+            if not output_is_current(previous_manifest, manifest, f"{static_prefix}/{entry.name}",
+                                     entry.path, [static_dest + entry.name])
+        ]
+        if changed_static:
+            with ThreadPoolExecutor(max_workers=min(32, len(changed_static))) as executor:
+                list(executor.map(
+                    lambda entry: install_static_file(
+                        entry.path, static_dest + entry.name, link=link_static
+                    ),
+                    changed_static
+                ))
+        remove_stale_files(output_path / "static", {static_dest + entry.name for entry in static_files})
         
-        # Ensure lightbox.js is included
-        lightbox_path = STATIC_DIR / "lightbox.js"
-        if not lightbox_path.exists():
+        # Ensure lightbox.js is included (checked against the listing, no extra stat)
+        if "lightbox.js" not in {entry.name for entry in static_files}:
             print("Warning: lightbox.js not found in static directory")
     
+    # Bind optional sections once rather than re-reading them per context key
+    title = listing.get("title", "Property Listing")
+    details = listing.get("details") or {}
+    seo = listing.get("seo") or {}
+    gallery = listing.get("gallery") or {}
+    theme = listing.get("theme") or {}
+    hero_cfg = listing.get("hero") or {}
+    media = listing.get("media") or {}
+    
+    # Format price with commas (only if price exists and > 0)
+    price = details.get("price", 0)
+    price_formatted = format_price(price) if price > 0 else None
+    sqft = details.get("sqft")
+    sqft_formatted = format_number(sqft) if sqft and sqft > 0 else None
+    
     # Prepare template context
     context = {
         # Basic listing data
         "listing": listing,
-        "title": listing.get("title", "Property Listing"),
+        "title": title,
         "address": listing.get("address", ""),
-        "details": listing.get("details", {}),
+        "details": details,
         
         # Photos - convert to simple list for template if needed
         "photos": photos,
@@ -873,49 +1827,48 @@ def build_site(input_path, output_path, hero_exists=False):
         "hero_image": hero_image,
         
         # Gallery organization
-        "gallery_organization": listing.get("gallery", {}).get("organization", "merged"),
-        "gallery_categories": listing.get("gallery", {}).get("categories", []),
+        "gallery_organization": gallery.get("organization", "merged"),
+        "gallery_categories": gallery.get("categories", []),
         
         # Agent info (optional)
-        "agent": listing.get("agent", {}),
+        "agent": agent,
         "agent_photo_path": f"agent/{agent_photo_filename}" if agent_photo_filename else None,
         
         # SEO
-        "seo_title": listing.get("seo", {}).get("title", listing.get("title", "Property Listing")),
-        "seo_description": listing.get("seo", {}).get("description", "Real estate listing"),
-        "seo_keywords": listing.get("seo", {}).get("keywords", []),
+        "seo_title": seo.get("title", title),
+        "seo_description": seo.get("description", "Real estate listing"),
+        "seo_keywords": seo.get("keywords", []),
         
         # Theme
-        "theme_scheme": listing.get("theme", {}).get("scheme", "classic-light"),
+        "theme_scheme": theme.get("scheme", "classic-light"),
         
         # Hero style
-        "hero_style": listing.get("hero", {}).get("style", "single"),
+        "hero_style": hero_cfg.get("style", "single"),
         
-        # Format price with commas (only if price exists and > 0)
-        "price_formatted": f"${listing.get('details', {}).get('price', 0):,}" if listing.get('details', {}).get('price', 0) > 0 else None,
+        "price_formatted": price_formatted,
+        "sqft_formatted": sqft_formatted,
         
         # Media
-        "matterport_url": listing.get("media", {}).get("matterport_url"),
-        "video_url": listing.get("media", {}).get("video_url"),
+        "matterport_url": media.get("matterport_url"),
+        "video_url": media.get("video_url"),
     }
     
-    # Setup Jinja2
-    env = Environment(
-        loader=FileSystemLoader(str(TEMPLATES_DIR)),
-        autoescape=select_autoescape(['html', 'xml'])
-    )
-    
-    # Render template
+    # Render template (environment and parsed template are cached per process)
+    # Chunks stream straight to disk instead of building one large string;
+    # a temporary file keeps the previous index.html if rendering fails
+    output_file = output_path / "index.html"
+    partial_file = output_path / "index.html.tmp"
     try:
-        template = env.get_template("listing.html")
-        html = template.render(**context)
+        template = _get_template()
+        with open(partial_file, 'wb') as f:
+            template.stream(**context).dump(f, encoding='utf-8')
+        os.replace(partial_file, output_file)
     except Exception as e:
-        print(f"Error rendering template: {e}")
-        sys.exit(1)
+        if os.path.exists(partial_file):
+            os.unlink(partial_file)
+        raise ListingError(f"Could not render template: {e}") from e
     
-    # Write HTML output
-    output_file = output_path / "index.html"
-    output_file.write_text(html, encoding='utf-8')
+    save_build_manifest(output_path, manifest, image_options)
     
     print(f"✓ Site built successfully!")
     print(f"  Output: {output_path}/index.html")
@@ -923,11 +1876,73 @@ def build_site(input_path, output_path, hero_exists=False):
     print(f"  Theme: {context['theme_scheme']}")
     print(f"\nTo preview: open {output_path}/index.html in a browser")
 
-def main():
-    """Main CLI entry point."""
+def build_batch(input_root, output_root, jobs=1, link_static=False, keep_icc=False,
+                keep_original=False, avif=False, webp=True):
+    """Build every listing folder under input_root into output_root/<folder name>."""
+    input_root = Path(input_root)
+    output_root = Path(output_root)
+    
+    if not input_root.is_dir():
+        raise ListingError(f"Input root not found: {input_root}")
+    
+    listings = sorted(sub for sub in input_root.iterdir() if os.path.exists(sub / "listing.json"))
+    if not listings:
+        raise ListingError(f"No listing folders with listing.json found in {input_root}")
+    
+    print(f"Building {len(listings)} listings from {input_root}")
+    
+    # One process reuses the cached Jinja environment for every listing; with
+    # --jobs > 1, each worker process keeps its own cache across its listings
+    failures = []
+    if jobs > 1:
+        # Each listing's image pool gets its share of the cores, so jobs x
+        # cpu_count image processes never run at once
+        workers = max(1, (os.cpu_count() or 1) // jobs)
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(build_site, sub, output_root / sub.name,
+                                link_static=link_static, keep_icc=keep_icc,
+                                keep_original=keep_original, avif=avif, webp=webp,
+                                workers=workers): sub
+                for sub in listings
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    # Any per-listing failure (bad photo, malformed listing.json)
+                    # is reported in the summary instead of aborting the batch
+                    failures.append((futures[future].name, e))
+    else:
+        for sub in listings:
+            try:
+                build_site(sub, output_root / sub.name, link_static=link_static,
+                           keep_icc=keep_icc, keep_original=keep_original, avif=avif,
+                           webp=webp)
+            except Exception as e:
+                failures.append((sub.name, e))
+    
+    for name, error in failures:
+        print(f"❌ {name}: {error}")
+    
+    if failures:
+        raise ListingError(f"{len(failures)} of {len(listings)} listings failed to build")
+    
+    print(f"\n✓ Built {len(listings)} listings into {output_root}")
+
+def main(offer_deploy=True, prog='site.py'):
+    """Main CLI entry point; offer_deploy is passed through to the wizard.
+    
+    prog names the calling script in help text (site_no_deploy.py passes its
+    own), and the Netlify lines are left out when deployment is not offered.
+    """
+    deploy_feature = "\n  • Automated Netlify deployment" if offer_deploy else ""
+    deploy_tracking = "\n    .netlify/         # Deployment tracking\n      state.json" if offer_deploy else ""
+    deploy_step = "\n  8. Deploying to Netlify (optional)" if offer_deploy else ""
+    
     parser = argparse.ArgumentParser(
-        prog='site.py',
-        description="""
+        prog=prog,
+        description=f"""
 Real Estate Tour Generator - Create beautiful property listing websites
 
 This tool generates stunning, mobile-responsive real estate tour websites 
@@ -939,26 +1954,31 @@ from photos and property details. Features include:
   • Smart hero image selection
   • Multiple themes (Classic, Luxury, Modern)
   • Optional Matterport/video tours
-  • Agent profiles with photos
-  • Automated Netlify deployment
+  • Agent profiles with photos{deploy_feature}
   • SEO optimization
 
 For more information, see: https://github.com/ryanpedersonphotography/real-estate-generator
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+        epilog=f"""
 Examples:
   
   Interactive wizard (recommended):
-    python3 site.py wizard
+    python3 %(prog)s wizard
   
   Build from existing listing.json:
-    python3 site.py build --input my-property --output dist/my-property
+    python3 %(prog)s build --input my-property --output dist/my-property
+  
+  Build every listing under a folder in one run:
+    python3 %(prog)s build-batch --input-root listings --output-root dist
+  
+  Precompile templates for faster builds:
+    python3 %(prog)s compile-templates
   
   Quick start:
     1. Create folder: my-property/
     2. Add photos to: my-property/photos/
-    3. Run: python3 site.py wizard
+    3. Run: python3 %(prog)s wizard
     4. Follow prompts to generate site
 
 Project structure:
@@ -968,9 +1988,7 @@ Project structure:
       interior/
     hero.jpg          # Optional: Hero image
     agent.jpg         # Optional: Agent photo
-    listing.json      # Generated by wizard or created manually
-    .netlify/         # Deployment tracking
-      state.json
+    listing.json      # Generated by wizard or created manually{deploy_tracking}
 
 For detailed documentation, visit the GitHub repository.
         """
@@ -994,7 +2012,7 @@ For detailed documentation, visit the GitHub repository.
         'build', 
         help='Build a site from existing listing.json',
         description='Build a static site from an existing listing.json file and photos.',
-        epilog='Example: python3 site.py build --input my-property --output dist/my-property'
+        epilog='Example: python3 %(prog)s --input my-property --output dist/my-property'
     )
     build_parser.add_argument(
         '--input',
@@ -1008,12 +2026,102 @@ For detailed documentation, visit the GitHub repository.
         metavar='PATH',
         help='Path to output folder for generated site'
     )
+    build_parser.add_argument(
+        '--link-static',
+        action='store_true',
+        help='Hard-link CSS/JS assets into the output instead of copying them'
+    )
+    build_parser.add_argument(
+        '--keep-icc',
+        action='store_true',
+        help='Keep embedded ICC color profiles in photos (EXIF is always stripped)'
+    )
+    build_parser.add_argument(
+        '--keep-original-jpegs',
+        action='store_true',
+        help='Copy JPEGs already within 1920px unchanged (minus metadata) '
+             'instead of re-encoding them at quality 85'
+    )
+    build_parser.add_argument(
+        '--avif',
+        action='store_true',
+        help='Also write AVIF copies of gallery photos (smaller than WebP, much slower to encode)'
+    )
+    build_parser.add_argument(
+        '--no-webp',
+        dest='webp',
+        action='store_false',
+        help='Skip the WebP copies of gallery photos (faster first build, JPEG only)'
+    )
+    
+    # Batch build command
+    batch_parser = subparsers.add_parser(
+        'build-batch',
+        help='Build every listing folder under a directory in one run',
+        description='Build all subfolders of an input root that contain a listing.json, '
+                    'writing each site to a folder of the same name under the output root.',
+        epilog='Example: python3 %(prog)s --input-root listings --output-root dist'
+    )
+    batch_parser.add_argument(
+        '--input-root',
+        required=True,
+        metavar='PATH',
+        help='Folder containing one listing folder per property'
+    )
+    batch_parser.add_argument(
+        '--output-root',
+        required=True,
+        metavar='PATH',
+        help='Folder to write the generated sites into'
+    )
+    batch_parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Number of listings to build in parallel processes (default: 1)'
+    )
+    batch_parser.add_argument(
+        '--link-static',
+        action='store_true',
+        help='Hard-link CSS/JS assets into each output instead of copying them'
+    )
+    batch_parser.add_argument(
+        '--keep-icc',
+        action='store_true',
+        help='Keep embedded ICC color profiles in photos (EXIF is always stripped)'
+    )
+    batch_parser.add_argument(
+        '--keep-original-jpegs',
+        action='store_true',
+        help='Copy JPEGs already within 1920px unchanged (minus metadata) '
+             'instead of re-encoding them at quality 85'
+    )
+    batch_parser.add_argument(
+        '--avif',
+        action='store_true',
+        help='Also write AVIF copies of gallery photos (smaller than WebP, much slower to encode)'
+    )
+    batch_parser.add_argument(
+        '--no-webp',
+        dest='webp',
+        action='store_false',
+        help='Skip the WebP copies of gallery photos (faster first build, JPEG only)'
+    )
+    
+    # Compile templates command
+    subparsers.add_parser(
+        'compile-templates',
+        help='Precompile templates to Python modules for faster builds',
+        description='Compile templates/ ahead of time into compiled_templates/. '
+                    'Builds use the compiled modules while they are newer than the sources.'
+    )
     
     # Wizard command
     wizard_parser = subparsers.add_parser(
         'wizard', 
         help='Interactive wizard to create and build listing (recommended)',
-        description="""
+        description=f"""
 Interactive wizard mode - the easiest way to create a listing!
 
 The wizard will guide you through:
@@ -1023,8 +2131,7 @@ The wizard will guide you through:
   4. Entering property details (all optional)
   5. Configuring agent information
   6. Selecting theme and style
-  7. Building the site
-  8. Deploying to Netlify (optional)
+  7. Building the site{deploy_step}
 
 All fields are optional - press Enter to skip any field.
         """,
@@ -1033,12 +2140,25 @@ All fields are optional - press Enter to skip any field.
     
     args = parser.parse_args()
     
-    if args.command == 'build':
-        build_site(args.input, args.output)
-    elif args.command == 'wizard':
-        wizard_mode()
-    else:
-        parser.print_help()
+    try:
+        if args.command == 'build':
+            build_site(args.input, args.output, link_static=args.link_static,
+                       keep_icc=args.keep_icc, keep_original=args.keep_original_jpegs,
+                       avif=args.avif, webp=args.webp)
+        elif args.command == 'build-batch':
+            build_batch(args.input_root, args.output_root, jobs=args.jobs,
+                        link_static=args.link_static, keep_icc=args.keep_icc,
+                        keep_original=args.keep_original_jpegs, avif=args.avif,
+                        webp=args.webp)
+        elif args.command == 'wizard':
+            wizard_mode(offer_deploy=offer_deploy)
+        elif args.command == 'compile-templates':
+            compile_templates()
+        else:
+            parser.print_help()
+            sys.exit(1)
+    except ListingError as e:
+        print(f"Error: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
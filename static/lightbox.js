@@ -15,6 +15,7 @@
     let nextBtn = null;
     let closeBtn = null;
     let lightboxCounter = null;
+    let preferredFormat = null;
     
     // Initialize lightbox on DOM ready
     document.addEventListener('DOMContentLoaded', initLightbox);
@@ -28,8 +29,19 @@
         
         // Store image sources and add click handlers
         galleryItems.forEach((img, index) => {
+            // data-full-webp / data-full-avif hold the same photo in modern formats
+            const variants = {};
+            Object.keys(img.dataset).forEach(key => {
+                if (key.startsWith('full') && key.length > 4) {
+                    variants[key.slice(4).toLowerCase()] = img.dataset[key];
+                }
+            });
+            
             galleryImages.push({
-                src: img.src,
+                // Grid shows thumbnails; the lightbox opens the full-size photo
+                src: img.dataset.full || img.src,
+                variants: variants,
+                element: img,
                 alt: img.alt
             });
             
@@ -124,6 +136,12 @@
     
     function openLightbox(index) {
         currentIndex = index;
+        
+        // Use the format the browser picked for the clicked thumbnail's <picture>
+        const match = /\.(\w+)(?:[?#]|$)/.exec(galleryImages[index].element.currentSrc || '');
+        if (match) {
+            preferredFormat = match[1].toLowerCase();
+        }
         updateLightboxImage();
         
         // Show lightbox
@@ -153,19 +171,20 @@
         if (galleryImages.length === 0) return;
         
         const image = galleryImages[currentIndex];
+        const src = (preferredFormat && image.variants[preferredFormat]) || image.src;
         
         // Update image with loading state
         lightbox.classList.add('lightbox-loading');
         
         const tempImg = new Image();
         tempImg.onload = () => {
-            lightboxImg.src = image.src;
+            lightboxImg.src = src;
             lightboxImg.alt = image.alt;
             lightboxCaption.textContent = image.alt;
             lightboxCounter.textContent = `${currentIndex + 1} / ${galleryImages.length}`;
             lightbox.classList.remove('lightbox-loading');
         };
-        tempImg.src = image.src;
+        tempImg.src = src;
         
         // Update navigation button visibility
         prevBtn.style.display = currentIndex > 0 ? 'block' : 'none';
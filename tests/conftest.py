@@ -0,0 +1,37 @@
+import importlib
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+TESTS_DIR = Path(__file__).resolve().parent
+
+
+@pytest.fixture(scope="session")
+def sitegen():
+    """site.py as a module, importable by name in image pool workers too."""
+    if str(TESTS_DIR) not in sys.path:
+        sys.path.insert(0, str(TESTS_DIR))
+    return importlib.import_module("real_estate_site")
+
+
+@pytest.fixture
+def make_listing(tmp_path):
+    """Create a listing folder with the given photos/ paths as small JPEGs."""
+    from PIL import Image
+
+    def _make(photo_paths, size=(640, 480)):
+        listing = tmp_path / "listing"
+        for index, relative in enumerate(photo_paths):
+            path = listing / "photos" / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            Image.new("RGB", size, (40 * index % 256, 120, 200)).save(path, "JPEG")
+        (listing / "listing.json").write_text(json.dumps({
+            "title": "Test Home",
+            "address": "1 Test St",
+            "details": {"price": 100000, "beds": 2, "baths": 1, "sqft": 900},
+        }))
+        return listing
+
+    return _make
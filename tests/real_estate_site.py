@@ -0,0 +1,15 @@
+"""Importable alias for site.py; `import site` would resolve to the stdlib module.
+
+Living on sys.path lets spawn/forkserver pool workers unpickle its functions.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+_spec = importlib.util.spec_from_file_location(
+    __name__, Path(__file__).resolve().parent.parent / "site.py"
+)
+assert _spec is not None and _spec.loader is not None
+_module = importlib.util.module_from_spec(_spec)
+sys.modules[__name__] = _module
+_spec.loader.exec_module(_module)
@@ -0,0 +1,131 @@
+import json
+import shutil
+
+import pytest
+from PIL import Image
+
+
+def test_build_multi_folder_listing(sitegen, make_listing, tmp_path):
+    listing = make_listing([
+        "exterior/01-front.jpg",
+        "exterior/02-back.jpg",
+        "interior/03-kitchen.jpg",
+        "04-master-bedroom.jpg",
+    ])
+    output = tmp_path / "site"
+
+    sitegen.build_site(listing, output)
+
+    assert (output / "index.html").is_file()
+    for relative in ("exterior/01-front.jpg", "exterior/02-back.jpg",
+                     "interior/03-kitchen.jpg", "04-master-bedroom.jpg"):
+        assert (output / "photos" / relative).is_file()
+        assert (output / "thumbs" / relative).is_file()
+
+
+def test_rebuild_removes_photos_deleted_from_listing(sitegen, make_listing, tmp_path):
+    listing = make_listing(["exterior/01-front.jpg", "interior/02-kitchen.jpg"])
+    output = tmp_path / "site"
+    sitegen.build_site(listing, output)
+
+    (listing / "photos" / "interior" / "02-kitchen.jpg").unlink()
+    (listing / "photos" / "interior").rmdir()
+    sitegen.build_site(listing, output)
+
+    assert (output / "photos" / "exterior" / "01-front.jpg").is_file()
+    assert not (output / "photos" / "interior").exists()
+    assert not (output / "thumbs" / "interior").exists()
+
+
+def test_repeated_image_task_rewrites_outputs(sitegen, make_listing, tmp_path):
+    listing = make_listing(["01-front.jpg"])
+    src = str(listing / "photos" / "01-front.jpg")
+    dest = tmp_path / "out.jpg"
+    thumb = tmp_path / "thumb.jpg"
+    task = sitegen.ImageTask(src, str(dest), str(thumb), mode="pair")
+
+    sitegen.run_image_task(task)
+    dest.unlink()
+    thumb.unlink()
+    # The worker exists for its side effects; an identical task must run again
+    sitegen.run_image_task(task)
+
+    assert dest.is_file()
+    assert thumb.is_file()
+
+
+def test_gallery_thumbnails_cover_grid_cells(sitegen, make_listing, tmp_path):
+    listing = make_listing(["01-front.jpg"], size=(1600, 1200))
+    output = tmp_path / "site"
+    sitegen.build_site(listing, output)
+
+    with Image.open(output / "thumbs" / "01-front.jpg") as thumb:
+        assert thumb.size == (800, 600)
+
+
+def test_build_batch_reports_failures_and_keeps_going(sitegen, make_listing, tmp_path):
+    good = make_listing(["01-front.jpg"])
+    root = tmp_path / "listings"
+    root.mkdir()
+    shutil.move(str(good), str(root / "a-good"))
+    bad = root / "b-bad"
+    shutil.copytree(root / "a-good", bad)
+    # A malformed section raises a plain exception, not a ListingError
+    listing = json.loads((bad / "listing.json").read_text())
+    listing["agent"] = "oops"
+    (bad / "listing.json").write_text(json.dumps(listing))
+
+    for jobs in (1, 2):
+        output = tmp_path / f"dist-{jobs}"
+        with pytest.raises(sitegen.ListingError, match="1 of 2 listings failed"):
+            sitegen.build_batch(root, output, jobs=jobs)
+        assert (output / "a-good" / "index.html").is_file()
+
+
+def test_build_rejects_listing_without_required_fields(sitegen, make_listing, tmp_path):
+    listing = make_listing(["01-front.jpg"])
+    (listing / "listing.json").write_text(json.dumps({"title": "Home", "details": {"price": 1}}))
+
+    with pytest.raises(sitegen.ListingError,
+                       match="address, details.baths, details.beds, details.sqft"):
+        sitegen.build_site(listing, tmp_path / "site")
+
+
+def test_build_rejects_non_object_details(sitegen, make_listing, tmp_path):
+    listing = make_listing(["01-front.jpg"])
+    (listing / "listing.json").write_text(json.dumps({"title": "Home", "address": "1 St",
+                                                      "details": "oops"}))
+
+    with pytest.raises(sitegen.ListingError, match="'details' must be an object"):
+        sitegen.build_site(listing, tmp_path / "site")
+
+
+def test_web_variants_keep_the_full_filename(sitegen, make_listing, tmp_path):
+    if "webp" not in [entry[0] for entry in sitegen.available_web_formats()]:
+        pytest.skip("Pillow build cannot write WebP")
+    listing = make_listing(["a.jpg", "a.jpeg"])
+    output = tmp_path / "site"
+
+    sitegen.build_site(listing, output)
+
+    assert (output / "photos" / "a.jpg.webp").is_file()
+    assert (output / "photos" / "a.jpeg.webp").is_file()
+    assert not list(output.glob("*/*.avif"))
+    html = (output / "index.html").read_text()
+    assert 'srcset="thumbs/a.jpg.webp"' in html
+    assert 'srcset="thumbs/a.jpeg.webp"' in html
+
+
+def test_no_webp_writes_jpeg_only_and_drops_old_variants(sitegen, make_listing, tmp_path):
+    if "webp" not in [entry[0] for entry in sitegen.available_web_formats()]:
+        pytest.skip("Pillow build cannot write WebP")
+    listing = make_listing(["a.jpg"])
+    output = tmp_path / "site"
+    sitegen.build_site(listing, output)
+    assert (output / "photos" / "a.jpg.webp").is_file()
+
+    sitegen.build_site(listing, output, webp=False)
+
+    assert (output / "photos" / "a.jpg").is_file()
+    assert not list(output.glob("*/*.webp"))
+    assert ".webp" not in (output / "index.html").read_text()
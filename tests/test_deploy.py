@@ -0,0 +1,29 @@
+import os
+import threading
+
+import pytest
+
+
+def test_ctrl_c_at_deploy_menu_propagates(sitegen, tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    netlify = bin_dir / "netlify"
+    netlify.write_text("#!/bin/sh\nexec sleep 30\n")
+    netlify.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setattr(sitegen, "check_netlify_cli", lambda: True)
+    prompt_threads = []
+
+    def interrupt(prompt_text, default=None):
+        prompt_threads.append(threading.current_thread())
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(sitegen, "prompt_optional", interrupt)
+    property_path = tmp_path / "listing"
+    property_path.mkdir()
+
+    with pytest.raises(KeyboardInterrupt):
+        sitegen.handle_netlify_deployment(property_path, tmp_path / "site", "listing")
+
+    # A worker thread blocked in input() would keep asyncio.run from exiting
+    assert prompt_threads == [threading.main_thread()]
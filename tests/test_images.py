@@ -0,0 +1,126 @@
+import pytest
+from PIL import Image
+
+
+@pytest.fixture
+def np():
+    """numpy, skipping only the tests that need it when it is not installed."""
+    return pytest.importorskip("numpy")
+
+
+def _sample(np, mode):
+    rng = np.random.default_rng(0)
+    rgba = Image.fromarray(rng.integers(0, 256, (32, 48, 4), dtype=np.uint8), 'RGBA')
+    if mode.startswith('P'):
+        img = rgba.convert('RGB').convert('P')
+        if mode == 'P-transparent':
+            img.info['transparency'] = 0
+        return img
+    return rgba.convert(mode)
+
+
+@pytest.mark.parametrize("mode", ["RGBA", "LA", "P", "P-transparent"])
+def test_flatten_to_rgb_matches_without_numpy(sitegen, monkeypatch, np, mode):
+    img = _sample(np, mode)
+    vectorized = sitegen.flatten_to_rgb(img)
+
+    monkeypatch.setattr(sitegen, "NUMPY_AVAILABLE", False)
+    fallback = sitegen.flatten_to_rgb(img)
+
+    assert vectorized.mode == fallback.mode == 'RGB'
+    assert vectorized.tobytes() == fallback.tobytes()
+
+
+def test_flatten_to_rgb_blends_onto_white(sitegen):
+    img = Image.new('LA', (1, 1), (0, 0))
+    assert sitegen.flatten_to_rgb(img).getpixel((0, 0)) == (255, 255, 255)
+
+
+def test_thumbnail_cover_size(sitegen):
+    assert sitegen.thumbnail_cover_size((4000, 3000)) == (800, 600)
+    # Portrait photos keep enough width to cover a landscape grid cell
+    assert sitegen.thumbnail_cover_size((3000, 4000)) == (800, 1067)
+    assert sitegen.thumbnail_cover_size((640, 480)) == (640, 480)
+
+
+def test_web_sized_jpeg_is_reencoded_unless_kept(sitegen, tmp_path):
+    src = tmp_path / "src.jpg"
+    Image.new("RGB", (640, 480), (90, 120, 200)).save(src, "JPEG", quality=100)
+
+    sitegen.optimize_image(str(src), str(tmp_path / "default.jpg"))
+    sitegen.optimize_image(str(src), str(tmp_path / "kept.jpg"), keep_original=True)
+
+    assert (tmp_path / "default.jpg").read_bytes() != src.read_bytes()
+    assert (tmp_path / "kept.jpg").read_bytes() == src.read_bytes()
+
+
+def test_exif_rotated_photo_is_written_upright(sitegen, tmp_path):
+    src = tmp_path / "rotated.jpg"
+    exif = Image.Exif()
+    exif[sitegen.EXIF_ORIENTATION] = 6  # stored sideways, display rotated 90° clockwise
+    Image.new("RGB", (640, 480), (90, 120, 200)).save(src, "JPEG", exif=exif)
+    dest = tmp_path / "out.jpg"
+    thumb = tmp_path / "thumb.jpg"
+
+    assert not sitegen.is_web_ready_jpeg(str(src))
+    sitegen.process_image_pair(str(src), str(dest), str(thumb), keep_original=True)
+
+    with Image.open(dest) as img:
+        assert img.size == (480, 640)
+        assert img.getexif().get(sitegen.EXIF_ORIENTATION) is None
+    with Image.open(thumb) as img:
+        assert img.size == (480, 640)
+
+
+def _jpeg_with_metadata(path, **extra):
+    exif = Image.Exif()
+    exif[0x010F] = "TestCam"  # Make
+    Image.new("RGB", (64, 48), (90, 120, 200)).save(
+        path, "JPEG", exif=exif, comment=b"secret", icc_profile=b"icc" * 50, **extra)
+    return path.read_bytes()
+
+
+def _scan_data(data):
+    return data[data.index(b"\xff\xda"):]
+
+
+@pytest.mark.parametrize("keep_icc", [False, True])
+def test_copy_jpeg_without_metadata_drops_exif_and_comments(sitegen, tmp_path, keep_icc):
+    original = _jpeg_with_metadata(tmp_path / "src.jpg")
+    dest = tmp_path / "out.jpg"
+
+    sitegen.copy_jpeg_without_metadata(str(tmp_path / "src.jpg"), str(dest), keep_icc=keep_icc)
+
+    data = dest.read_bytes()
+    header = data[:data.index(b"\xff\xda")]
+    assert b"\xff\xe1" not in header and b"TestCam" not in header
+    assert b"\xff\xfe" not in header and b"secret" not in header
+    assert (b"ICC_PROFILE\0" in header) == keep_icc
+    assert _scan_data(data) == _scan_data(original)
+
+
+def test_copy_jpeg_without_metadata_skips_fill_bytes(sitegen, tmp_path):
+    original = _jpeg_with_metadata(tmp_path / "plain.jpg")
+    src = tmp_path / "filled.jpg"
+    src.write_bytes(b"\xff\xd8\xff\xff" + original[2:])  # 0xFF fill before the first marker
+    dest = tmp_path / "out.jpg"
+
+    sitegen.copy_jpeg_without_metadata(str(src), str(dest))
+
+    assert b"TestCam" not in dest.read_bytes()
+    assert _scan_data(dest.read_bytes()) == _scan_data(original)
+
+
+def test_unparseable_kept_jpeg_is_reencoded_not_copied(sitegen, tmp_path, monkeypatch):
+    src = tmp_path / "src.jpg"
+    _jpeg_with_metadata(src)
+
+    def fail(*args, **kwargs):
+        raise ValueError("malformed JPEG header")
+
+    monkeypatch.setattr(sitegen, "copy_jpeg_without_metadata", fail)
+    sitegen.process_image_pair(str(src), str(tmp_path / "out.jpg"), str(tmp_path / "thumb.jpg"),
+                               keep_original=True)
+
+    for name in ("out.jpg", "thumb.jpg"):
+        assert b"TestCam" not in (tmp_path / name).read_bytes()